@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark de inicialização do bitcoin_news_publisher.
+
+Mede, em subprocessos limpos:
+  1. O custo de importar o módulo (via `python -X importtime`).
+  2. O tempo até a primeira requisição de rede (resolução DNS da SerpApi).
+
+Termina com código 1 se algum orçamento for excedido.
+
+Uso:
+    python3 bench_startup.py [--import-budget-ms 50] [--first-request-budget-ms 1500] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+MODULE = "bitcoin_news_publisher"
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Script executado no subprocesso: intercepta a primeira resolução DNS,
+# registra o tempo decorrido e interrompe o fluxo antes de qualquer tráfego real.
+FIRST_REQUEST_SNIPPET = """
+import socket, sys, time
+
+class _FirstRequest(BaseException):
+    pass
+
+def _getaddrinfo(*args, **kwargs):
+    raise _FirstRequest(time.perf_counter())
+
+start = time.perf_counter()
+socket.getaddrinfo = _getaddrinfo
+import {module}
+try:
+    {module}.search_bitcoin_news()
+except _FirstRequest as e:
+    print((e.args[0] - start) * 1000)
+else:
+    sys.exit("Nenhuma requisição de rede foi feita.")
+"""
+
+FAKE_WP_CONFIG = """
+WP_URL = "https://example.invalid/"
+WP_USER = "bench"
+WP_APP_PASSWORD = "bench"
+PEXELS_API_KEY = "bench"
+COINGECKO_API_KEY = "bench"
+COINMARKETCAP_API_KEY = "bench"
+SERPAPI_API_KEY = "bench"
+"""
+
+def measure_import_ms(env):
+    """
+    Retorna o tempo cumulativo (ms) de importação do módulo segundo `-X importtime`.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        capture_output=True, text=True, cwd=HERE, env=env, check=True
+    )
+    for line in result.stderr.splitlines():
+        # Formato: "import time: self [us] | cumulative | imported package"
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == MODULE:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"Saída do importtime não contém '{MODULE}':\n{result.stderr}")
+
+def measure_first_request_ms(env):
+    """
+    Retorna o tempo (ms) entre o início do import e a primeira requisição de rede.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST_SNIPPET.format(module=MODULE)],
+        capture_output=True, text=True, cwd=HERE, env=env
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Falha ao medir a primeira requisição:\n{result.stderr}")
+    return float(result.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de inicialização do bitcoin_news_publisher.")
+    parser.add_argument("--import-budget-ms", type=float, default=50.0)
+    parser.add_argument("--first-request-budget-ms", type=float, default=1500.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        # wp_config.py falso, usado caso o projeto não tenha um próprio
+        with open(os.path.join(config_dir, "wp_config.py"), "w") as f:
+            f.write(FAKE_WP_CONFIG)
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [config_dir, HERE, env.get("PYTHONPATH")]))
+
+        import_ms = statistics.median(measure_import_ms(env) for _ in range(args.runs))
+        first_request_ms = statistics.median(measure_first_request_ms(env) for _ in range(args.runs))
+
+    failed = False
+    for label, value, budget in (
+        ("Import do módulo", import_ms, args.import_budget_ms),
+        ("Primeira requisição de rede", first_request_ms, args.first_request_budget_ms),
+    ):
+        status = "OK" if value <= budget else "EXCEDIDO"
+        failed = failed or value > budget
+        print(f"{label}: {value:.1f} ms (orçamento: {budget:.0f} ms) [{status}]")
+
+    if failed:
+        print("Orçamento de inicialização excedido.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
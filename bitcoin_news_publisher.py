@@ -1,24 +1,56 @@
 # -*- coding: utf-8 -*-
-import requests
 import json
 import os
-from openai import OpenAI
-from io import BytesIO
 
-# Carregar configurações do WordPress
-try:
-    from wp_config import WP_URL, WP_USER, WP_APP_PASSWORD, PEXELS_API_KEY, COINGECKO_API_KEY, COINMARKETCAP_API_KEY, SERPAPI_API_KEY
-except ImportError:
-    print("Erro: Arquivo wp_config.py não encontrado. Execute o teste de conexão primeiro.")
-    exit(1)
+# As dependências pesadas (requests, openai) são importadas sob demanda dentro
+# das funções, para que importar este módulo (ex: a partir do bot do Telegram)
+# seja rápido e não exija credenciais.
 
-# Configuração da API OpenAI (a chave é carregada automaticamente do ambiente)
-client = OpenAI()
+_config = None
+_client = None
+
+class ConfigError(Exception):
+    """
+    Erro levantado quando as configurações do wp_config.py não podem ser carregadas.
+    """
+
+def load_config():
+    """
+    Carrega (uma única vez) o módulo wp_config com as credenciais do WordPress e das APIs.
+    """
+    global _config
+    if _config is None:
+        try:
+            import wp_config
+        except ImportError as e:
+            raise ConfigError("Arquivo wp_config.py não encontrado. Execute o teste de conexão primeiro.") from e
+
+        required = (
+            "WP_URL", "WP_USER", "WP_APP_PASSWORD", "PEXELS_API_KEY",
+            "COINGECKO_API_KEY", "COINMARKETCAP_API_KEY", "SERPAPI_API_KEY",
+        )
+        missing = [name for name in required if not hasattr(wp_config, name)]
+        if missing:
+            raise ConfigError(f"Variáveis ausentes em wp_config.py: {', '.join(missing)}")
+        _config = wp_config
+    return _config
+
+def get_openai_client():
+    """
+    Cria o cliente OpenAI no primeiro uso (a chave é carregada automaticamente do ambiente).
+    """
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI()
+    return _client
 
 def search_bitcoin_news():
     """
     Busca notícias reais sobre Bitcoin usando a SerpApi (Google News).
     """
+    import requests
+    
     print("-> Buscando notícias reais sobre Bitcoin na SerpApi (Google News)...")
     
     SERPAPI_URL = "https://serpapi.com/search"
@@ -26,7 +58,7 @@ def search_bitcoin_news():
     params = {
         "engine": "google_news",
         "q": "Bitcoin",
-        "api_key": SERPAPI_API_KEY,
+        "api_key": load_config().SERPAPI_API_KEY,
         "hl": "pt", # Idioma
         "gl": "br", # País
         "num": 5 # Número de resultados
@@ -78,7 +110,7 @@ def search_bitcoin_news_llm_fallback():
     )
     
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4.1-mini",
             messages=[
                 {"role": "system", "content": "Você é um assistente de pesquisa de notícias financeiras."},
@@ -107,7 +139,7 @@ def generate_blog_post(news_summary):
     )
     
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4.1-mini",
             messages=[
                 {"role": "system", "content": "Você é um redator de conteúdo de blog profissional e especialista em SEO."},
@@ -168,7 +200,7 @@ def generate_seo_elements(title, content):
     )
     
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4.1-mini",
             messages=[
                 {"role": "system", "content": "Você é um especialista em SEO."},
@@ -206,7 +238,7 @@ def extract_keywords(content):
     )
     
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4.1-mini",
             messages=[
                 {"role": "system", "content": "Você é um analista de conteúdo e extrator de palavras-chave."},
@@ -226,11 +258,13 @@ def search_pexels_images(keywords):
     """
     Busca 4 imagens para cada palavra-chave no Pexels e retorna uma lista de URLs.
     """
+    import requests
+    
     print("-> Buscando imagens no Pexels para as palavras-chave...")
     
     PEXELS_URL = "https://api.pexels.com/v1/search"
     headers = {
-        "Authorization": PEXELS_API_KEY
+        "Authorization": load_config().PEXELS_API_KEY
     }
     
     all_image_data = []
@@ -267,6 +301,8 @@ def download_image(image_data):
     """
     Baixa uma imagem do Pexels e retorna o caminho local.
     """
+    import requests
+    
     print(f"-> Baixando imagem ID {image_data['id']}...")
     
     photo_url = image_data['url']
@@ -313,7 +349,7 @@ def match_and_select_images(content, image_data):
     )
     
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4.1-mini",
             messages=[
                 {"role": "system", "content": "Você é um especialista em curadoria de imagens para blogs."},
@@ -350,10 +386,14 @@ def upload_media(file_path, title):
     """
     Faz o upload da imagem para a biblioteca de mídia do WordPress.
     """
+    import requests
+    
+    cfg = load_config()
+    
     print("-> Fazendo upload da mídia para o WordPress...")
     
-    API_URL = f"{WP_URL}wp-json/wp/v2/media"
-    auth = (WP_USER, WP_APP_PASSWORD)
+    API_URL = f"{cfg.WP_URL}wp-json/wp/v2/media"
+    auth = (cfg.WP_USER, cfg.WP_APP_PASSWORD)
     
     headers = {
         "Content-Disposition": f"attachment; filename={os.path.basename(file_path)}",
@@ -411,7 +451,7 @@ def insert_body_images(content, body_images, body_media_ids):
     )
     
     try:
-        response = client.chat.completions.create(
+        response = get_openai_client().chat.completions.create(
             model="gpt-4.1-mini",
             messages=[
                 {"role": "system", "content": "Você é um editor de blocos do Gutenberg."},
@@ -432,13 +472,17 @@ def get_or_create_tag_ids(keywords):
     """
     Verifica se as tags existem e as cria se necessário, retornando uma lista de IDs.
     """
+    import requests
+    
+    cfg = load_config()
+    
     print("-> Gerenciando Tags...")
     tag_ids = []
     
     for keyword in keywords:
         # 1. Tenta buscar a tag
-        TAGS_URL = f"{WP_URL}wp-json/wp/v2/tags?search={keyword}"
-        auth = (WP_USER, WP_APP_PASSWORD)
+        TAGS_URL = f"{cfg.WP_URL}wp-json/wp/v2/tags?search={keyword}"
+        auth = (cfg.WP_USER, cfg.WP_APP_PASSWORD)
         
         try:
             response = requests.get(TAGS_URL, auth=auth, timeout=5)
@@ -451,7 +495,7 @@ def get_or_create_tag_ids(keywords):
                 continue
             
             # 2. Se não existir, cria a tag
-            CREATE_TAG_URL = f"{WP_URL}wp-json/wp/v2/tags"
+            CREATE_TAG_URL = f"{cfg.WP_URL}wp-json/wp/v2/tags"
             tag_data = {
                 "name": keyword
             }
@@ -472,9 +516,13 @@ def get_all_categories():
     """
     Busca todas as categorias existentes no WordPress e retorna um dicionário {nome: id}.
     """
+    import requests
+    
+    cfg = load_config()
+    
     print("-> Buscando categorias existentes no WordPress...")
     
-    CATEGORIES_URL = f"{WP_URL}wp-json/wp/v2/categories"
+    CATEGORIES_URL = f"{cfg.WP_URL}wp-json/wp/v2/categories"
     
     try:
         response = requests.get(CATEGORIES_URL, timeout=10)
@@ -514,10 +562,14 @@ def publish_to_wordpress(title, content, media_id, tag_ids, category_ids):
     """
     Publica o post no WordPress usando a API REST, incluindo o ID da mídia de destaque, Tags e Categorias.
     """
+    import requests
+    
+    cfg = load_config()
+    
     print("-> Tentando publicar no WordPress com Imagem, Tags e Categoria...")
     
-    API_URL = f"{WP_URL}wp-json/wp/v2/posts"
-    auth = (WP_USER, WP_APP_PASSWORD)
+    API_URL = f"{cfg.WP_URL}wp-json/wp/v2/posts"
+    auth = (cfg.WP_USER, cfg.WP_APP_PASSWORD)
     
     post_data = {
         "title": title,
@@ -557,6 +609,11 @@ def publish_to_wordpress(title, content, media_id, tag_ids, category_ids):
         return None
 
 def main():
+    import requests
+    
+    # 0. Carregar configurações (falha cedo se o wp_config.py estiver ausente)
+    cfg = load_config()
+    
     # 1. Pesquisar notícias
     news_summary = search_bitcoin_news()
     if not news_summary:
@@ -623,8 +680,8 @@ def main():
     """
     print("-> Tentando publicar no WordPress com Imagem de Destaque...")
     
-    API_URL = f"{WP_URL}wp-json/wp/v2/posts"
-    auth = (WP_USER, WP_APP_PASSWORD)
+    API_URL = f"{cfg.WP_URL}wp-json/wp/v2/posts"
+    auth = (cfg.WP_USER, cfg.WP_APP_PASSWORD)
     
     post_data = {
         "title": title,
@@ -664,4 +721,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except ConfigError as e:
+        print(f"Erro: {e}")
+        raise SystemExit(1)